@@ -54,11 +54,12 @@ researcher_datasets = [
 # Score each dataset
 results = scorer.score_batch(researcher_datasets)
 
-print("Dataset Scores:")
-for i, result in enumerate(results, 1):
-    print(f"  Dataset {i}: {result.total}")
-
 # Compute S-Index
 s_index = scorer.compute_s_index(results)
-print(f"\nS-Index: {s_index}")
-print(f"(Researcher has {s_index} datasets with SHARE score >= {s_index})")
+
+# Build the report first and write it once, rather than one print() per dataset
+lines = ["Dataset Scores:"]
+lines.extend(f"  Dataset {i}: {result.total:.1f}" for i, result in enumerate(results, 1))
+lines.append(f"\nS-Index: {s_index}")
+lines.append(f"(Researcher has {s_index} datasets with SHARE score >= {s_index})")
+print("\n".join(lines))
@@ -35,10 +35,12 @@ dataset = {
 }
 
 result = scorer.score(dataset)
-print(f"SHARE Score: {result.total}/100")
-print(f"  S (Stewardship):   {result.S}/20")
-print(f"  H (Harmonization): {result.H}/20")
-print(f"  A (Access):        {result.A}/20")
-print(f"  R (Reuse):         {result.R}/20")
-print(f"  E (Engagement):    {result.E}/20")
-print(f"  Non-reuse score:   {result.non_reuse_score}/80")
+print("\n".join([
+    f"SHARE Score: {result.total:.1f}/100",
+    f"  S (Stewardship):   {result.S}/20",
+    f"  H (Harmonization): {result.H}/20",
+    f"  A (Access):        {result.A}/20",
+    f"  R (Reuse):         {result.R:.1f}/20",
+    f"  E (Engagement):    {result.E}/20",
+    f"  Non-reuse score:   {result.non_reuse_score}/80",
+]))
@@ -0,0 +1,28 @@
+"""Build hook for the optional C scorer (share/_c_scorer.pyx).
+
+All metadata lives in pyproject.toml. The extension is compiled only when
+Cython is importable at build time, e.g.
+
+    pip install cython && pip install --no-build-isolation .
+
+Otherwise (or if the .pyx source is missing) the package installs as
+pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+C_SCORER_PYX = os.path.join("share", "_c_scorer.pyx")
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None and os.path.exists(C_SCORER_PYX):
+    ext_modules = cythonize(C_SCORER_PYX, language_level=3)
+else:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,80 @@
+# cython: language_level=3
+"""Optional C implementation of flat-dict SHARE scoring.
+
+Mirrors SHAREScorer._score_flat exactly, with every signal lookup and
+truth test done through the CPython C API. Build it in place with:
+
+    pip install cython && cythonize -i share/_c_scorer.pyx
+
+(or install from source with Cython available; see setup.py).
+SHAREScorer picks it up automatically when importable and falls back
+to the pure-Python scorer otherwise.
+"""
+
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject, PyObject_IsTrue
+from libc.math cimport log10
+
+from math import log10 as _py_log10
+
+from .signals import (
+    ACCESS_SIGNALS,
+    ACCESS_WEIGHTS,
+    ENGAGEMENT_SIGNALS,
+    HARMONIZATION_SIGNALS,
+    STEWARDSHIP_SIGNALS,
+)
+
+cdef tuple _STEWARDSHIP = tuple(STEWARDSHIP_SIGNALS)
+cdef tuple _HARMONIZATION = tuple(HARMONIZATION_SIGNALS)
+cdef tuple _ENGAGEMENT = tuple(ENGAGEMENT_SIGNALS)
+cdef tuple _ACCESS = tuple(ACCESS_SIGNALS)
+cdef tuple _ACCESS_WEIGHTS = tuple(ACCESS_WEIGHTS[sig] for sig in ACCESS_SIGNALS)
+cdef tuple _REUSE_KEYS = ("citation_count", "download_count", "derived_count")
+
+
+cdef inline int _is_set(dict record, object key) except -1:
+    """record.get(key) is truthy."""
+    cdef PyObject* value = PyDict_GetItem(record, key)
+    return value is not NULL and PyObject_IsTrue(<object>value)
+
+
+cdef inline int _score_boolean_bucket(dict record, tuple signals) except -1:
+    cdef int count = 0
+    for sig in signals:
+        count += _is_set(record, sig)
+    return 4 * count
+
+
+def score_flat_c(dict record, double reuse_scale):
+    """Score a flat signal dict; returns (S, H, A, R, E, total)."""
+    cdef int S = _score_boolean_bucket(record, _STEWARDSHIP)
+    cdef int H = _score_boolean_bucket(record, _HARMONIZATION)
+    cdef int E = _score_boolean_bucket(record, _ENGAGEMENT)
+
+    cdef int A = 0
+    cdef Py_ssize_t i
+    for i in range(len(_ACCESS)):
+        if _is_set(record, _ACCESS[i]):
+            A += <int>_ACCESS_WEIGHTS[i]
+    if A > 20:
+        A = 20
+
+    # Same arithmetic as _reuse_count / _log_scale_reuse, including
+    # min(20.0, x) returning 20.0 unless x < 20.0
+    cdef PyObject* value
+    count = 0
+    for key in _REUSE_KEYS:
+        value = PyDict_GetItem(record, key)
+        if value is not NULL and PyObject_IsTrue(<object>value):
+            count = count + <object>value
+    cdef double R = 0.0
+    if not count <= 0:
+        try:
+            R = reuse_scale * log10(count + 1)
+        except OverflowError:  # an int beyond double range; math.log10 takes it
+            R = reuse_scale * _py_log10(count + 1)
+        if not R < 20.0:
+            R = 20.0
+
+    return S, H, A, R, E, <double>(S + H + A) + R + E
@@ -0,0 +1,24 @@
+"""Numba-compiled array kernel for batch Reuse scoring.
+
+Importing this module requires Numba (pip install share-framework[jit]).
+The scorer imports it lazily on the first large batch and falls back to
+per-record math.log10 when Numba is missing.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def log_scale_reuse_arr(counts, scale):
+    """Log-scale an array of reuse counts to 0-20 (unrounded)."""
+    out = np.empty(counts.size, np.float64)
+    for i in range(counts.size):
+        c = counts[i]
+        if c <= 0:
+            out[i] = 0.0
+        else:
+            out[i] = min(20.0, scale * math.log10(c + 1.0))
+    return out
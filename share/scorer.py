@@ -9,9 +9,23 @@ Scoring formula:
   Total SHARE = S + H + A + R + E (0-100)
 """
 
-import math
+import heapq
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from math import log10 as _log10
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from .signals import (
     ACCESS_SIGNALS,
@@ -22,22 +36,125 @@ from .signals import (
     SignalMapping,
 )
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: pip install share-framework[fast]
+    np = None
+
+try:
+    from ._c_scorer import score_flat_c
+except ImportError:  # C extension is optional: see share/_c_scorer.pyx
+    score_flat_c = None
+
+# Batches smaller than this are scored record-by-record; below it the
+# NumPy setup cost outweighs the vectorized arithmetic.
+_NUMPY_MIN_BATCH = 32
+
+# Batches smaller than this skip the Numba Reuse kernel. Importing numba
+# costs a few hundred ms and the kernel saves well under 1 us per record
+# (the reuse counts are still summed in Python), so it only pays off on
+# very large batches.
+_NUMBA_MIN_BATCH = 500_000
+
+# Column layout of the signal matrix used for vectorized batch scoring:
+# S, H, A and E signals in bucket order.
+_MATRIX_SIGNALS = (
+    STEWARDSHIP_SIGNALS + HARMONIZATION_SIGNALS + ACCESS_SIGNALS + ENGAGEMENT_SIGNALS
+)
+# Per bucket: (first matrix column, per-signal weights)
+_MATRIX_BUCKETS = (
+    (0, [4] * len(STEWARDSHIP_SIGNALS)),
+    (len(STEWARDSHIP_SIGNALS), [4] * len(HARMONIZATION_SIGNALS)),
+    (
+        len(STEWARDSHIP_SIGNALS) + len(HARMONIZATION_SIGNALS),
+        [ACCESS_WEIGHTS[sig] for sig in ACCESS_SIGNALS],
+    ),
+    (
+        len(STEWARDSHIP_SIGNALS) + len(HARMONIZATION_SIGNALS) + len(ACCESS_SIGNALS),
+        [4] * len(ENGAGEMENT_SIGNALS),
+    ),
+)
+
+
+def _bucket_table(weights: List[int]) -> "np.ndarray":
+    """Capped bucket score for every bitmask of the bucket's signals."""
+    return np.array([
+        min(20, sum(w for bit, w in enumerate(weights) if mask >> bit & 1))
+        for mask in range(1 << len(weights))
+    ], dtype=np.int64)
+
+
+if np is not None:
+    # Each record's signals are packed into one integer (bit j = column j);
+    # a bucket's score is then a table lookup on its slice of the bits.
+    _MATRIX_BIT_VALUES = np.left_shift(1, np.arange(len(_MATRIX_SIGNALS), dtype=np.int64))
+    _BUCKET_TABLES = tuple(
+        (offset, _bucket_table(weights)) for offset, weights in _MATRIX_BUCKETS
+    )
+
+
+# Numeric fields summed into the Reuse bucket's event count
+_REUSE_KEYS = frozenset(("citation_count", "download_count", "derived_count"))
+
+# SHAREResult fields, in constructor order
+_RESULT_FIELDS = ("S", "H", "A", "R", "E", "total")
+_result_values = attrgetter(*_RESULT_FIELDS)
+_result_total = attrgetter("total")
+
+
+def _as_sequence(items: Iterable[Any]) -> Sequence[Any]:
+    """Materialize one-shot iterables; the batch paths need len() and re-iteration."""
+    return items if isinstance(items, Sequence) else list(items)
+
+
+def _require_numpy(feature: str) -> None:
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy: pip install share-framework[fast]")
+
+
+@lru_cache(maxsize=None)
+def _load_numba_kernels():
+    """Import the optional Numba kernels on first use, or return None.
+
+    Deferred until a batch reaches _NUMBA_MIN_BATCH rather than paid by
+    every `import share`.
+    """
+    try:
+        from . import _numba_kernels
+    except ImportError:  # Numba is optional: pip install share-framework[jit]
+        return None
+    return _numba_kernels
+
+
+def _s_index_sorted(totals: "np.ndarray") -> int:
+    """S-Index of an ascending-sorted array of SHARE totals."""
+    # (scores >= k) == n - searchsorted(k) is non-increasing in k, so
+    # the ks satisfying it form a prefix whose length is the S-Index.
+    n = totals.size
+    ks = np.arange(1, n + 1)
+    counts_ge = n - np.searchsorted(totals, ks, side="left")
+    return int(np.count_nonzero(counts_ge >= ks))
+
 
 @dataclass
 class SHAREResult:
     """Result of scoring a single dataset."""
 
+    # No per-instance __dict__: batch scoring creates one of these per record.
+    # (Declared by hand because dataclass(slots=True) needs Python 3.10.)
+    __slots__ = ("S", "H", "A", "R", "E", "total")
+
     S: float  # Stewardship (0-20)
     H: float  # Harmonization (0-20)
     A: float  # Access (0-20)
-    R: float  # Reuse (0-20)
+    R: float  # Reuse (0-20), unrounded
     E: float  # Engagement (0-20)
-    total: float  # Sum (0-100)
+    total: float  # Sum (0-100), unrounded; __repr__ shows one decimal
 
     def __repr__(self) -> str:
         return (
             f"SHAREResult(S={self.S}, H={self.H}, A={self.A}, "
-            f"R={self.R}, E={self.E}, total={self.total})"
+            f"R={self.R:.1f}, E={self.E}, total={self.total:.1f})"
         )
 
     def as_dict(self) -> Dict[str, float]:
@@ -46,6 +163,13 @@ class SHAREResult:
             "R": self.R, "E": self.E, "total": self.total,
         }
 
+    def rounded(self) -> "SHAREResult":
+        """Copy with R and total rounded to one decimal place."""
+        return SHAREResult(
+            S=self.S, H=self.H, A=self.A, R=round(self.R, 1), E=self.E,
+            total=round(self.total, 1),
+        )
+
     @property
     def non_reuse_score(self) -> float:
         """Deposit-time score (excludes outcome-based Reuse bucket)."""
@@ -62,11 +186,76 @@ class SHAREScorer:
        metadata into SHARE signals.
     """
 
-    # Log base for reuse scaling: 10,000 reuse events = 20 points
+    # Log base for reuse scaling: 10,000 reuse events = 20 points.
+    # Read when a scorer is constructed; change it (on the class or a
+    # subclass) before creating scorers, not on one that already exists.
     REUSE_LOG_BASE = 10_000
 
+    # Flat-dict hooks the C scorer inlines; subclasses overriding any of
+    # them are scored in Python so the override takes effect.
+    _C_SCORER_HOOKS = (
+        "_score_boolean_bucket",
+        "_score_access",
+        "_score_reuse",
+        "_reuse_count",
+        "_log_scale_reuse",
+    )
+    _use_c_scorer = score_flat_c is not None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        overriding = cls.__mro__[:cls.__mro__.index(SHAREScorer)]
+        cls._use_c_scorer = score_flat_c is not None and not any(
+            name in vars(klass) for klass in overriding for name in cls._C_SCORER_HOOKS
+        )
+
     def __init__(self, mapping: Optional[SignalMapping] = None):
-        self.mapping = mapping
+        # 20 / log10(REUSE_LOG_BASE), precomputed so scaling is a single multiply
+        self._reuse_scale = 20.0 / _log10(self.REUSE_LOG_BASE)
+        self.set_mapping(mapping)
+
+    @property
+    def mapping(self) -> Optional[SignalMapping]:
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, mapping: Optional[SignalMapping]) -> None:
+        self.set_mapping(mapping)
+
+    def set_mapping(self, mapping: Optional[SignalMapping]) -> None:
+        """Attach a SignalMapping (or None for flat dict mode).
+
+        The mapping is compiled here into a specialized scoring function
+        (see _compile_mapping_scorer). Compiled scorers are cached by the
+        mapping's callables, so scorers built from the same mapping share
+        one. Call again after mutating a mapping that is already attached.
+        """
+        self._mapping = mapping
+        if mapping is None:
+            self._score_mapped = None
+            return
+        m = mapping
+        spec = (
+            tuple(m.stewardship.values()) if m.stewardship else (),
+            tuple(m.harmonization.values()) if m.harmonization else (),
+            tuple(
+                (ACCESS_WEIGHTS.get(key, 4), fn) for key, fn in m.access.items()
+            ) if m.access else (),
+            m.reuse.get("reuse_count") if m.reuse else None,
+            tuple(m.engagement.values()) if m.engagement else (),
+            self._reuse_scale,
+        )
+        try:
+            hash(spec)
+        except TypeError:  # an unhashable callable: compile without caching
+            self._score_mapped = _compile_mapping_scorer.__wrapped__(*spec)
+        else:
+            self._score_mapped = _compile_mapping_scorer(*spec)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the compiled scorers shared between SHAREScorer instances."""
+        _compile_mapping_scorer.cache_clear()
 
     def score(self, record: Dict[str, Any]) -> SHAREResult:
         """Score a dataset record.
@@ -79,25 +268,119 @@ class SHAREScorer:
         Returns:
             SHAREResult with per-bucket and total scores.
         """
-        if self.mapping:
-            return self._score_with_mapping(record)
+        if self._score_mapped is not None:
+            return self._score_mapped(record)
         return self._score_flat(record)
 
     def score_record(self, record: Dict[str, Any]) -> SHAREResult:
         """Alias for score()."""
         return self.score(record)
 
+    def score_iter(self, records: Iterable[Dict[str, Any]]) -> Iterator[SHAREResult]:
+        """Lazily score records, one SHAREResult at a time.
+
+        Unlike score_batch(), never holds more than one result, so it can
+        consume arbitrarily large streams (e.g. records read from disk).
+        """
+        return map(self.score, records)
+
     def score_batch(self, records: List[Dict[str, Any]]) -> List[SHAREResult]:
-        """Score multiple records."""
+        """Score multiple records.
+
+        Large flat-dict batches are scored with NumPy when it is installed.
+        """
+        records = _as_sequence(records)
+        if np is not None and not self.mapping and len(records) >= _NUMPY_MIN_BATCH:
+            return self.score_batch_array(records)
         return [self.score(r) for r in records]
 
+    def score_batch_array(self, records: List[Dict[str, Any]]) -> List[SHAREResult]:
+        """Score multiple records with vectorized NumPy arithmetic.
+
+        Thin adapter over score_batch_soa() for callers that want
+        SHAREResult objects. Requires NumPy. Records are scored one by one
+        in mapping mode.
+        """
+        _require_numpy("score_batch_array")
+        records = _as_sequence(records)
+        if self.mapping:
+            return [self.score(r) for r in records]
+        columns = self.score_batch_soa(records)
+        return [
+            SHAREResult(*row)
+            for row in zip(*(columns[key].tolist() for key in _RESULT_FIELDS))
+        ]
+
+    def score_batch_soa(self, records: List[Dict[str, Any]]) -> Dict[str, "np.ndarray"]:
+        """Score multiple records into columnar NumPy arrays.
+
+        Returns a dict keyed "S", "H", "A", "R", "E" and "total", each an
+        array with one entry per record, so portfolio-level aggregates
+        (np.median(cols["total"]), compute_s_index_arr(cols["total"]))
+        run without touching per-record objects.
+
+        In flat dict mode, builds one records x signals 0/1 matrix, packs
+        each row into a bitmask and reads every bucket score from a lookup
+        table instead of summing per record in Python. Requires NumPy.
+        """
+        _require_numpy("score_batch_soa")
+        records = _as_sequence(records)
+        if self.mapping:
+            # One pass straight into a records x fields array; no list of
+            # SHAREResult objects or per-column lists is kept around.
+            n = len(records)
+            rows = np.fromiter(
+                chain.from_iterable(map(_result_values, map(self.score, records))),
+                dtype=np.float64, count=n * len(_RESULT_FIELDS),
+            ).reshape(n, len(_RESULT_FIELDS))
+            columns = dict(zip(_RESULT_FIELDS, rows.T.copy()))
+            for key in ("S", "H", "A", "E"):
+                columns[key] = columns[key].astype(np.int64)
+            return columns
+
+        n = len(records)
+        k = len(_MATRIX_SIGNALS)
+        matrix = np.fromiter(
+            map(bool, chain.from_iterable(map(r.get, _MATRIX_SIGNALS) for r in records)),
+            dtype=np.uint8, count=n * k,
+        ).reshape(n, k)
+        masks = matrix @ _MATRIX_BIT_VALUES
+        S, H, A, E = (
+            table[(masks >> offset) & (table.size - 1)] for offset, table in _BUCKET_TABLES
+        )
+
+        R = None
+        kernels = _load_numba_kernels() if n >= _NUMBA_MIN_BATCH else None
+        if kernels is not None:
+            try:
+                counts = np.fromiter(map(self._reuse_count, records), dtype=np.float64, count=n)
+            except OverflowError:  # an int count beyond float64 range
+                pass
+            else:
+                R = kernels.log_scale_reuse_arr(counts, self._reuse_scale)
+        if R is None:
+            # Scalar math.log10 per record: np.log10 can differ from it in the
+            # last ulp, and batch scores must match score() exactly.
+            R = np.fromiter(map(self._score_reuse, records), dtype=np.float64, count=n)
+
+        total = S + H + A + R + E
+        return {"S": S, "H": H, "A": A, "R": R, "E": E, "total": total}
+
     def compute_s_index(self, results: List[SHAREResult]) -> int:
         """Compute the S-Index from a list of SHARE results.
 
         S-Index = max(k) where the researcher has k datasets
         with SHARE score >= k.
         """
-        scores = sorted([r.total for r in results], reverse=True)
+        results = _as_sequence(results)
+        if np is not None and len(results) >= _NUMPY_MIN_BATCH:
+            totals = np.fromiter(
+                (r.total for r in results), dtype=np.float64, count=len(results)
+            )
+            totals.sort()
+            return _s_index_sorted(totals)
+
+        scores = sorted(map(_result_total, results), reverse=True)
         s_index = 0
         for i, score in enumerate(scores):
             if score >= (i + 1):
@@ -106,6 +389,29 @@ class SHAREScorer:
                 break
         return s_index
 
+    def compute_s_index_arr(self, totals: "np.ndarray") -> int:
+        """Compute the S-Index from an array of SHARE totals.
+
+        Columnar counterpart of compute_s_index(), e.g. for the "total"
+        column of score_batch_soa(). Requires NumPy.
+        """
+        _require_numpy("compute_s_index_arr")
+        return _s_index_sorted(np.sort(np.asarray(totals, dtype=np.float64), axis=None))
+
+    def compute_s_index_streaming(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Score records and compute their S-Index in a single streaming pass.
+
+        Keeps a min-heap of the current top-h totals, where h is the running
+        S-Index: every kept total is >= h. O(N log h) time, O(h) memory.
+        """
+        heap: List[float] = []
+        for result in self.score_iter(records):
+            heapq.heappush(heap, result.total)
+            # At most one total can fall below the new heap size
+            if heap[0] < len(heap):
+                heapq.heappop(heap)
+        return len(heap)
+
     # --- Internal scoring methods ---
 
     def _score_flat(self, record: Dict[str, Any]) -> SHAREResult:
@@ -115,74 +421,109 @@ class SHAREScorer:
         A = self._score_access(record)
         R = self._score_reuse(record)
         E = self._score_boolean_bucket(record, ENGAGEMENT_SIGNALS)
-        total = round(S + H + A + R + E, 1)
+        total = S + H + A + R + E
         return SHAREResult(S=S, H=H, A=A, R=R, E=E, total=total)
 
-    def _score_with_mapping(self, record: Dict[str, Any]) -> SHAREResult:
-        """Score using a SignalMapping to extract signals from raw metadata."""
-        m = self.mapping
-
-        # Stewardship
-        s_signals = [fn(record) for fn in m.stewardship.values()] if m.stewardship else []
-        S = 4 * sum(bool(s) for s in s_signals)
-
-        # Harmonization
-        h_signals = [fn(record) for fn in m.harmonization.values()] if m.harmonization else []
-        H = 4 * sum(bool(s) for s in h_signals)
-
-        # Access — mapping functions should return booleans for standard access signals
-        if m.access:
-            a_total = 0
-            for key, fn in m.access.items():
-                weight = ACCESS_WEIGHTS.get(key, 4)
-                if fn(record):
-                    a_total += weight
-            A = min(20, a_total)
-        else:
-            A = 0
-
-        # Reuse — mapping should have a "reuse_count" function returning a number
-        if m.reuse and "reuse_count" in m.reuse:
-            count = m.reuse["reuse_count"](record) or 0
-            R = self._log_scale_reuse(count)
-        else:
-            R = 0.0
+    if score_flat_c is not None:
+        _score_flat_py = _score_flat
 
-        # Engagement
-        e_signals = [fn(record) for fn in m.engagement.values()] if m.engagement else []
-        E = 4 * sum(bool(s) for s in e_signals)
-
-        total = round(S + H + A + R + E, 1)
-        return SHAREResult(S=S, H=H, A=A, R=R, E=E, total=total)
+        def _score_flat(self, record: Dict[str, Any]) -> SHAREResult:
+            """Score from a flat dict, in C when the extension is built."""
+            if type(record) is dict and self._use_c_scorer:
+                return SHAREResult(*score_flat_c(record, self._reuse_scale))
+            return self._score_flat_py(record)
 
     @staticmethod
     def _score_boolean_bucket(record: Dict[str, Any], signals: List[str]) -> int:
         """Score a bucket with 5 boolean signals x 4 pts each."""
-        return 4 * sum(1 for sig in signals if record.get(sig))
+        # map() keeps the per-key lookups and truth tests in C
+        return 4 * sum(map(bool, map(record.get, signals)))
 
     @staticmethod
     def _score_access(record: Dict[str, Any]) -> int:
         """Score the Access bucket (value-weighted, 20 max)."""
-        total = 0
-        for sig in ACCESS_SIGNALS:
-            if record.get(sig):
-                total += ACCESS_WEIGHTS[sig]
-        return min(20, total)
+        # ACCESS_WEIGHTS unrolled by hand; tests check it stays in sync.
+        total = (
+            (8 if record.get("is_open_access") else 0)
+            + (4 if record.get("has_license") else 0)
+            + (4 if record.get("is_permissive_license") else 0)
+            + (4 if record.get("has_download_url") else 0)
+        )
+        return 20 if total > 20 else total
 
     def _score_reuse(self, record: Dict[str, Any]) -> float:
         """Score the Reuse bucket (log-scaled, 20 max)."""
-        count = (
+        # Fresh deposits usually carry no reuse fields at all; skip the math.
+        # (keys().isdisjoint probes only the 3 keys; frozenset.isdisjoint(dict)
+        # would walk the whole record.)
+        if record.keys().isdisjoint(_REUSE_KEYS):
+            return 0.0
+        return self._log_scale_reuse(self._reuse_count(record))
+
+    @staticmethod
+    def _reuse_count(record: Dict[str, Any]) -> float:
+        """Combined reuse events: citations + downloads + derived works."""
+        return (
             (record.get("citation_count") or 0)
             + (record.get("download_count") or 0)
             + (record.get("derived_count") or 0)
         )
-        return self._log_scale_reuse(count)
 
-    @classmethod
-    def _log_scale_reuse(cls, count: int) -> float:
+    def _log_scale_reuse(self, count: int) -> float:
         """Log-scale reuse count to 0-20 range."""
         if count <= 0:
             return 0.0
-        return min(20.0, round(
-            20.0 * math.log10(count + 1) / math.log10(cls.REUSE_LOG_BASE), 1
-        ))
+        return min(20.0, self._reuse_scale * _log10(count + 1))
+
+
+@lru_cache(maxsize=64)
+def _compile_mapping_scorer(
+    stewardship: Tuple[Callable, ...],
+    harmonization: Tuple[Callable, ...],
+    access: Tuple[Tuple[int, Callable], ...],
+    reuse: Optional[Callable],
+    engagement: Tuple[Callable, ...],
+    reuse_scale: float,
+) -> Callable[[Dict[str, Any]], SHAREResult]:
+    """Generate a straight-line scoring function for one SignalMapping.
+
+    Each mapping callable is bound as a default argument (a fast local) and
+    each bucket is unrolled into a single expression, so scoring a record
+    does no dict lookups or iteration over the mapping.
+
+    Cached on the callables themselves rather than on id(mapping): a cache
+    hit always means identical scoring logic, even for a different (or
+    since mutated) SignalMapping object.
+    """
+    namespace: Dict[str, Any] = {"_Result": SHAREResult, "_log10": _log10}
+
+    def weighted_sum(prefix: str, weighted_fns) -> str:
+        terms = []
+        for i, (weight, fn) in enumerate(weighted_fns):
+            name = f"_{prefix}{i}"
+            namespace[name] = fn
+            terms.append(f"({weight} if {name}(record) else 0)")
+        return " + ".join(terms) or "0"
+
+    lines = [
+        f"    S = 4 * ({weighted_sum('s', ((1, fn) for fn in stewardship))})",
+        f"    H = 4 * ({weighted_sum('h', ((1, fn) for fn in harmonization))})",
+        f"    A = min(20, {weighted_sum('a', access)})",
+    ]
+    if reuse is None:
+        lines.append("    R = 0.0")
+    else:
+        namespace["_reuse"] = reuse
+        lines += [
+            "    count = _reuse(record) or 0",
+            "    R = 0.0 if count <= 0 else "
+            f"min(20.0, {reuse_scale!r} * _log10(count + 1))",
+        ]
+    lines += [
+        f"    E = 4 * ({weighted_sum('e', ((1, fn) for fn in engagement))})",
+        "    return _Result(S, H, A, R, E, S + H + A + R + E)",
+    ]
+    params = ", ".join(f"{name}={name}" for name in namespace)
+    src = f"def _score_mapped(record, {params}):\n" + "\n".join(lines) + "\n"
+    exec(compile(src, "<share mapped scorer>", "exec"), namespace)
+    return namespace["_score_mapped"]
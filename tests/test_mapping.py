@@ -0,0 +1,79 @@
+"""Mapping mode: the compiled per-mapping scorer and its cache."""
+
+import pytest
+
+import share.scorer
+from share import SHAREResult, SHAREScorer, SignalMapping
+
+
+def full_mapping():
+    """A mapping that fills all five buckets, with one access key unknown to ACCESS_WEIGHTS."""
+    return SignalMapping(
+        stewardship={
+            "has_consent": lambda r: r.get("consent"),
+            "has_contributors": lambda r: r.get("authors"),
+        },
+        harmonization={"has_methods": lambda r: r.get("methods")},
+        access={
+            "is_open_access": lambda r: r.get("open"),
+            "has_license": lambda r: r.get("license"),
+            "has_api": lambda r: r.get("api"),  # not in ACCESS_WEIGHTS: worth 4
+        },
+        reuse={"reuse_count": lambda r: r.get("uses")},
+        engagement={
+            "has_keywords": lambda r: r.get("keywords"),
+            "has_funding": lambda r: r.get("funder"),
+        },
+    )
+
+
+@pytest.mark.parametrize("record, expected", [
+    ({}, SHAREResult(0, 0, 0, 0.0, 0, 0.0)),
+    (
+        {
+            "consent": True, "authors": ["a"], "methods": "yes", "open": 1,
+            "license": "CC-BY", "api": True, "uses": 9999, "keywords": ["k"],
+            "funder": "NSF",
+        },
+        SHAREResult(8, 4, 16, 20.0, 8, 56.0),
+    ),
+    ({"uses": 99, "api": True}, SHAREResult(0, 0, 4, 10.0, 0, 14.0)),
+    ({"uses": 10 ** 400, "open": True}, SHAREResult(0, 0, 8, 20.0, 0, 28.0)),
+    ({"uses": None, "authors": [], "funder": "NSF"}, SHAREResult(0, 0, 0, 0.0, 4, 4.0)),
+    ({"uses": -3, "consent": 1}, SHAREResult(4, 0, 0, 0.0, 0, 4.0)),
+    ({"uses": float("nan")}, SHAREResult(0, 0, 0, 20.0, 0, 20.0)),
+])
+def test_compiled_mapping_scorer(record, expected):
+    assert SHAREScorer(full_mapping()).score(record) == expected
+
+
+def test_scorers_share_compiled_mapping_scorer():
+    SHAREScorer.clear_cache()
+    mapping = full_mapping()
+    first, second = SHAREScorer(mapping), SHAREScorer(mapping)
+    assert first._score_mapped is second._score_mapped
+    info = share.scorer._compile_mapping_scorer.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    SHAREScorer.clear_cache()
+    info = share.scorer._compile_mapping_scorer.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_unhashable_mapping_callable_still_scores():
+    class Flag:
+        """Callable with __eq__ but no __hash__, so it cannot be a cache key."""
+
+        def __init__(self, key):
+            self.key = key
+
+        def __eq__(self, other):
+            return isinstance(other, Flag) and other.key == self.key
+
+        def __call__(self, record):
+            return record.get(self.key)
+
+    SHAREScorer.clear_cache()
+    scorer = SHAREScorer(SignalMapping(access={"is_open_access": Flag("open")}))
+    assert scorer.score({"open": True}).A == 8
+    assert share.scorer._compile_mapping_scorer.cache_info().currsize == 0
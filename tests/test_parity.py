@@ -0,0 +1,198 @@
+"""Every scoring backend must produce bit-identical results to score()."""
+
+import itertools
+import random
+from collections import UserDict
+from types import MappingProxyType
+
+import pytest
+
+import share.scorer
+from share import SHAREResult, SHAREScorer, SignalMapping
+from share.signals import (
+    ACCESS_SIGNALS,
+    ACCESS_WEIGHTS,
+    ENGAGEMENT_SIGNALS,
+    HARMONIZATION_SIGNALS,
+    STEWARDSHIP_SIGNALS,
+)
+
+np = pytest.importorskip("numpy")
+
+SIGNALS = STEWARDSHIP_SIGNALS + HARMONIZATION_SIGNALS + ACCESS_SIGNALS + ENGAGEMENT_SIGNALS
+REUSE_FIELDS = ("citation_count", "download_count", "derived_count")
+
+
+def make_records(n=2000, seed=1):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        record = {
+            sig: rng.choice([True, False, None, 1, 0, "x", ""])
+            for sig in SIGNALS if rng.random() < 0.7
+        }
+        for field in REUSE_FIELDS:
+            if rng.random() < 0.5:
+                record[field] = rng.choice([
+                    None, 0, -5, float("nan"),
+                    rng.randint(0, 20_000), rng.random() * 50,
+                ])
+        records.append(record)
+    return records
+
+
+RECORDS = make_records()
+
+# Reuse edge cases (NaN, None, negative, huge) plus records that are
+# mappings but not exact dicts, which the C scorer must hand back to Python.
+EDGE_RECORDS = [
+    {},
+    {"citation_count": float("nan")},
+    {"citation_count": None, "download_count": None},
+    {"citation_count": -5, "download_count": 3},
+    {"derived_count": -1.5, "has_consent": None},
+    {"citation_count": 10 ** 12, "is_open_access": 1},
+    {"citation_count": 10 ** 400, "has_license": True},
+    {sig: True for sig in SIGNALS},
+    UserDict(RECORDS[0]),
+    MappingProxyType(RECORDS[1]),
+    UserDict({"citation_count": float("nan"), "has_license": "yes"}),
+]
+ALL_RECORDS = EDGE_RECORDS + RECORDS
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def batch_backend(request, monkeypatch):
+    """Run a test against both the NumPy fallback and the Numba kernel."""
+    if request.param == "numpy":
+        monkeypatch.setattr(share.scorer, "_load_numba_kernels", lambda: None)
+    elif share.scorer._load_numba_kernels() is None:
+        pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(share.scorer, "_NUMBA_MIN_BATCH", 0)
+    return request.param
+
+
+def test_score_batch_matches_score(batch_backend):
+    scorer = SHAREScorer()
+    # ALL_RECORDS has a count past float64 range, which the kernel can't take
+    for records in (RECORDS, ALL_RECORDS):
+        assert scorer.score_batch(records) == [scorer.score(r) for r in records]
+
+
+def test_batch_apis_accept_one_shot_iterables(batch_backend):
+    scorer = SHAREScorer()
+    expected = [scorer.score(r) for r in RECORDS]
+    assert scorer.score_batch(iter(RECORDS)) == expected
+    assert scorer.score_batch_array(iter(RECORDS)) == expected
+    columns = scorer.score_batch_soa(iter(RECORDS))
+    assert columns["total"].tolist() == [r.total for r in expected]
+    assert scorer.compute_s_index(scorer.score_iter(RECORDS)) == scorer.compute_s_index(expected)
+
+
+def test_subclass_reuse_log_base_applies_to_every_path(batch_backend):
+    class Base100(SHAREScorer):
+        REUSE_LOG_BASE = 100
+
+    scorer = Base100()
+    assert scorer.score({"citation_count": 9}).R == 10.0
+    assert scorer.score_batch(ALL_RECORDS) == [scorer.score(r) for r in ALL_RECORDS]
+
+
+def test_reuse_log_base_set_on_class_applies_to_new_scorers(monkeypatch):
+    monkeypatch.setattr(SHAREScorer, "REUSE_LOG_BASE", 100)
+    scorer = SHAREScorer()
+    assert scorer.score({"citation_count": 9}).R == 10.0
+    assert scorer.score_batch([{"citation_count": 9}] * 40)[0].R == 10.0
+
+
+def s_index_cases(seed=2):
+    """Lists of totals: hand-picked edge cases, then random ones."""
+    rng = random.Random(seed)
+    cases = [[], [0], [1], [1, 1], [3, 3, 3], [2, 2, 2, 2], [0.5, 100], [5] * 5]
+    for _ in range(2000):
+        n = rng.randint(0, 80)
+        # Integer totals give plenty of ties and totals exactly equal to k
+        cases.append([
+            rng.choice([rng.randint(0, n + 2), rng.uniform(0, n + 2)]) for _ in range(n)
+        ])
+    return cases
+
+
+class TotalsScorer(SHAREScorer):
+    """Scores each "record" as a result with that total, to drive S-Index paths."""
+
+    def score(self, total):
+        return SHAREResult(0, 0, 0, 0.0, 0, total)
+
+
+def test_s_index_paths_match_definition():
+    scorer = TotalsScorer()
+    for totals in s_index_cases():
+        expected = sum(1 for k, t in enumerate(sorted(totals, reverse=True), 1) if t >= k)
+        assert scorer.compute_s_index(list(map(scorer.score, totals))) == expected, totals
+        assert scorer.compute_s_index_arr(np.array(totals, dtype=float)) == expected, totals
+        assert scorer.compute_s_index_streaming(totals) == expected, totals
+        assert scorer.compute_s_index_streaming(iter(totals)) == expected, totals
+
+
+@pytest.mark.parametrize("mapped", [False, True], ids=["flat", "mapping"])
+def test_score_batch_soa_matches_score(batch_backend, mapped):
+    mapping = None
+    if mapped:
+        mapping = SignalMapping(
+            stewardship={sig: (lambda r, k=sig: r.get(k)) for sig in STEWARDSHIP_SIGNALS},
+            harmonization={sig: (lambda r, k=sig: r.get(k)) for sig in HARMONIZATION_SIGNALS},
+            access={sig: (lambda r, k=sig: r.get(k)) for sig in ACCESS_SIGNALS},
+            reuse={"reuse_count": SHAREScorer._reuse_count},
+            engagement={sig: (lambda r, k=sig: r.get(k)) for sig in ENGAGEMENT_SIGNALS},
+        )
+    scorer = SHAREScorer(mapping)
+    expected = [scorer.score(r) for r in ALL_RECORDS]
+    if mapped:
+        assert expected == [SHAREScorer().score(r) for r in ALL_RECORDS]
+    columns = scorer.score_batch_soa(ALL_RECORDS)
+    for key in ("S", "H", "A", "R", "E", "total"):
+        assert columns[key].tolist() == [getattr(r, key) for r in expected], key
+
+
+def test_flat_backends_match_score():
+    scorer = SHAREScorer()
+    score_flat_py = getattr(scorer, "_score_flat_py", scorer._score_flat)
+    for record in ALL_RECORDS:
+        assert score_flat_py(record) == scorer.score(record)
+
+
+def test_c_scorer_matches_python():
+    if share.scorer.score_flat_c is None:
+        pytest.skip("C extension not built")
+    scorer = SHAREScorer()
+    for record in ALL_RECORDS:
+        if type(record) is dict:
+            c_result = SHAREResult(*share.scorer.score_flat_c(record, scorer._reuse_scale))
+            assert c_result == scorer._score_flat_py(record)
+
+
+def test_subclass_hook_overrides_apply_with_or_without_c_scorer():
+    class NoAccess(SHAREScorer):
+        @staticmethod
+        def _score_access(record):
+            return 0
+
+    class CappedReuse(NoAccess):
+        def _log_scale_reuse(self, count):
+            return 1.0 if count > 0 else 0.0
+
+    record = {"is_open_access": True, "citation_count": 50}
+    assert NoAccess().score(record).A == 0
+    assert CappedReuse().score(record).R == 1.0
+    assert SHAREScorer().score(record).A == 8
+
+
+def test_score_access_matches_access_weights():
+    for n in range(len(ACCESS_SIGNALS) + 1):
+        for present in itertools.combinations(ACCESS_SIGNALS, n):
+            record = dict.fromkeys(present, True)
+            expected = min(20, sum(ACCESS_WEIGHTS[sig] for sig in present))
+            assert SHAREScorer._score_access(record) == expected, present
+            assert SHAREScorer().score(record).A == expected, present